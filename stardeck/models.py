@@ -2,7 +2,24 @@ import re
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class SlideMeta:
+    """Frontmatter keys the renderer reads per slide, resolved once at parse time."""
+
+    layout: str = "default"
+    transition: str | None = None
+    background: str | None = None
+
+    @classmethod
+    def from_frontmatter(cls, frontmatter: dict) -> "SlideMeta":
+        return cls(
+            layout=frontmatter.get("layout", "default"),
+            transition=frontmatter.get("transition"),
+            background=frontmatter.get("background"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class SlideInfo:
     content: str
     index: int
@@ -11,21 +28,43 @@ class SlideInfo:
     title: str = ""
     max_clicks: int = 0
     range_clicks: frozenset[tuple[int, int]] = field(default_factory=frozenset)
+    meta: SlideMeta = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "meta", SlideMeta.from_frontmatter(self.frontmatter))
+        # frontmatter is a plain dict, so the generated dataclass hash can't be used
+        fields = (self.content, self.index, _freeze(self.frontmatter), self.note, self.title, self.max_clicks)
+        object.__setattr__(self, "_hash", hash(fields))
+
+    def __hash__(self) -> int:
+        return self._hash
 
     @property
     def layout(self) -> str:
-        return self.frontmatter.get("layout", "default")
+        return self.meta.layout
 
     @property
     def transition(self) -> str:
-        return self.frontmatter.get("transition", "fade")
+        return self.meta.transition or "fade"
 
     @property
     def background(self) -> str | None:
-        return self.frontmatter.get("background")
+        return self.meta.background
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, set | frozenset):
+        # Equal sets may iterate in different orders; only a frozenset hashes consistently
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    return value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeckConfig:
     title: str = "Untitled"
     summary: str = ""
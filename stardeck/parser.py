@@ -1,5 +1,6 @@
 import re
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from pathlib import Path
 
 import yaml
@@ -10,6 +11,7 @@ from starhtml.plugins import enter, exit_, visibility
 from stardeck.models import Deck, DeckConfig, SlideInfo
 
 _YAML_KEY_RE = re.compile(r"^[\w-]+:\s*")
+_DELIMITER_RE = re.compile(r"^---[^\S\n]*$", re.M)
 _NOTES_RE = re.compile(r"<!--\s*notes\s*\n(.*?)-->", re.DOTALL)
 _CLICK_RE = re.compile(
     r"<(click|after)(\s[^>]*)?>(.+?)</\1>",
@@ -27,8 +29,12 @@ _REGION_RE = re.compile(
 )
 
 
-def _is_slide_delimiter(line: str) -> bool:
-    return line.rstrip() == "---"
+def _iter_lines(s: str, pos: int = 0):
+    """Yield (start, end) offsets of each line so callers slice only what they keep."""
+    while (end := s.find("\n", pos)) != -1:
+        yield pos, end
+        pos = end + 1
+    yield pos, len(s)
 
 
 def _is_yaml_like(text: str) -> bool:
@@ -37,56 +43,50 @@ def _is_yaml_like(text: str) -> bool:
     return bool(lines) and all(_YAML_KEY_RE.match(ln) for ln in lines)
 
 
-def _find_frontmatter_end(lines: list[str], start: int) -> int:
-    for i in range(start, len(lines)):
-        if _is_slide_delimiter(lines[i]):
-            return i
-    return -1
-
-
 def split_slides(content: str) -> list[str]:
     """Slidev-style mid-deck frontmatter (--- / YAML / ---) attaches to the
     following slide rather than being treated as a separate delimiter."""
-    lines = content.split("\n")
     slides: list[str] = []
-    current: list[str] = []
+    # One C-level scan finds every delimiter line; the loop only visits those
+    delims = [m.span() for m in _DELIMITER_RE.finditer(content)]
+    # Offset of the pending slide's first line; past the end means no lines yet
+    seg_start = 0
     i = 0
 
-    while i < len(lines):
-        line = lines[i]
-
-        if _is_slide_delimiter(line):
-            fm_end = _find_frontmatter_end(lines, i + 1)
-            if fm_end > i + 1 and _is_yaml_like("\n".join(lines[i + 1 : fm_end])):
-                if current or slides:
-                    slides.append("\n".join(current))
-                current = lines[i : fm_end + 1]
-                i = fm_end + 1
-                continue
-
-            if current or slides:
-                slides.append("\n".join(current))
-            current = []
-        else:
-            current.append(line)
+    while i < len(delims):
+        start, end = delims[i]
         i += 1
-
-    if current or not slides:
-        slides.append("\n".join(current))
+        if seg_start < start:
+            slides.append(content[seg_start : start - 1])
+        elif slides:
+            slides.append("")
+        seg_start = end + 1
+
+        if i < len(delims):
+            fm_start, _ = delims[i]
+            if fm_start > end + 1 and _is_yaml_like(content[end + 1 : fm_start - 1]):
+                seg_start = start
+                i += 1
+
+    if seg_start <= len(content):
+        slides.append(content[seg_start:])
+    elif not slides:
+        slides.append("")
     return slides
 
 
 def parse_frontmatter(raw: str) -> tuple[dict, str]:
-    if not raw.startswith("---"):
+    if not raw.startswith("---") or (body_start := raw.find("\n") + 1) == 0:
         return {}, raw
 
-    lines = raw.split("\n")
-    end_idx = next((i for i, ln in enumerate(lines[1:], 1) if ln.strip() == "---"), None)
-    if end_idx is None:
+    for start, end in _iter_lines(raw, body_start):
+        if raw.find("---", start, end) != -1 and raw[start:end].strip() == "---":
+            break
+    else:
         return {}, raw
 
-    yaml_content = "\n".join(lines[1:end_idx])
-    remaining = "\n".join(lines[end_idx + 1 :])
+    yaml_content = raw[body_start : max(start - 1, body_start)]
+    remaining = raw[end + 1 :]
 
     try:
         frontmatter = yaml.safe_load(yaml_content) or {}
@@ -343,24 +343,59 @@ def extract_notes(content: str) -> tuple[str, str]:
     return "".join(parts).strip(), notes
 
 
-def _create_markdown_renderer() -> MarkdownIt:
-    from pygments import highlight
-    from pygments.formatters import HtmlFormatter
+@lru_cache(maxsize=64)
+def _get_lexer(lang: str):
+    """Lexers are stateless between highlight() calls, so one per language is enough."""
     from pygments.lexers import get_lexer_by_name
     from pygments.lexers.special import TextLexer
+    from pygments.util import ClassNotFound
+
+    if not lang:
+        return TextLexer()
+    try:
+        return get_lexer_by_name(lang)
+    except ClassNotFound:
+        pass
+    # Fences like ```hpp or ```main.py name an extension rather than an alias
+    if alias := _ext_to_alias().get(lang.rsplit(".", 1)[-1].lower()):
+        return get_lexer_by_name(alias)
+    return TextLexer()
+
+
+@cache
+def _ext_to_alias() -> dict[str, str]:
+    """Extension → alias table built in memory; never probes the filesystem."""
+    from pygments.lexers import get_all_lexers
+
+    table: dict[str, str] = {}
+    for _name, aliases, patterns, _mimetypes in get_all_lexers(plugins=False):
+        if not aliases:
+            continue
+        for pattern in patterns:
+            ext = pattern.removeprefix("*.")
+            if ext != pattern and not any(c in ext for c in "*?["):
+                table.setdefault(ext.lower(), aliases[0])
+    return table
+
+
+@cache
+def _get_formatter():
+    from pygments.formatters import HtmlFormatter
+
+    return HtmlFormatter(nowrap=True)
+
 
+def _create_markdown_renderer() -> MarkdownIt:
     md = MarkdownIt().enable("table")
-    formatter = HtmlFormatter(nowrap=True)
 
     def render_fence(self, tokens, idx, options, env):
+        # Pygments is only imported once a deck actually contains a code fence
+        from pygments import highlight
+
         token = tokens[idx]
         code = token.content.rstrip("\n")
         lang = token.info.strip() if token.info else ""
-        try:
-            lexer = get_lexer_by_name(lang) if lang else TextLexer()
-        except Exception:
-            lexer = TextLexer()
-        highlighted = highlight(code, lexer, formatter)
+        highlighted = highlight(code, _get_lexer(lang), _get_formatter())
         return f'<pre><code class="language-{lang}">{highlighted}</code></pre>\n'
 
     md.add_render_rule("fence", render_fence)
@@ -439,10 +474,12 @@ def parse_deck(filepath: Path, *, use_motion: bool = False) -> Deck:
     return Deck(slides=slides, config=DeckConfig(**config_fields))
 
 
+_CLICK_TAG_RE = re.compile(rb"<(?:click|after|clicks)[\s>]")
+
+
 def deck_has_clicks(deck_path: Path) -> bool:
-    """Avoids full parsing — just scans raw text."""
-    text = deck_path.read_text()
-    return any(f"<{tag}>" in text or f"<{tag} " in text for tag in ("click", "after", "clicks"))
+    """Avoids full parsing — one regex pass over the raw bytes."""
+    return _CLICK_TAG_RE.search(deck_path.read_bytes()) is not None
 
 
 def build_click_signals(deck: Deck, clicks_signal) -> list:
@@ -1,11 +1,14 @@
+import re
+import sys
 from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from star_drawing import DrawingCanvas, drawing_toolbar
-from starhtml import H3, Button, Div, NotStr, Signal, Span, get
+from starhtml import H3, Button, Div, NotStr, Signal, Span, get, to_xml
 from starhtml.datastar import evt, js, seq
 
-from stardeck.models import Deck, SlideInfo
+from stardeck.models import Deck, DeckConfig, SlideInfo
 
 if TYPE_CHECKING:
     from stardeck.server import PresentationState
@@ -21,6 +24,7 @@ HASH_UPDATE_EFFECT = js(
 
 
 _IMAGE_LAYOUTS = frozenset({"image-left", "image-right", "hero", "caption"})
+_BG_COLOR_RE = re.compile(r"#|rgba?\(|hsla?\(|(?:transparent|currentColor)$")
 
 
 def _resolve_asset_url(raw: str) -> str:
@@ -31,13 +35,37 @@ def _resolve_asset_url(raw: str) -> str:
     return f"/{raw}"
 
 
+# Class fragments repeat across slides and decks; intern them once
+@lru_cache(maxsize=1024)
+def _slide_class(index: int) -> str:
+    return sys.intern(f"slide-{index}")
+
+
+@lru_cache(maxsize=64)
+def _layout_class(layout: str) -> str:
+    return sys.intern(f"layout-{layout}")
+
+
+@lru_cache(maxsize=64)
+def _transition_class(transition: str) -> str:
+    return sys.intern(f"transition-{transition}")
+
+
 def render_slide(slide: SlideInfo, deck: Deck) -> Div:
-    transition = slide.frontmatter.get("transition") or deck.config.transition
+    return _render_slide(slide, deck.config)
+
+
+@lru_cache(maxsize=256)
+def _render_slide(slide: SlideInfo, config: DeckConfig) -> Div:
+    # Output depends only on the slide and deck config, so unchanged slides
+    # are served from cache across requests and live reloads
+    meta = slide.meta
+    transition = meta.transition or config.transition
 
     classes = [
-        f"slide-{slide.index}",
-        f"layout-{slide.layout}",
-        f"transition-{transition}",
+        _slide_class(slide.index),
+        _layout_class(meta.layout),
+        _transition_class(transition),
         "slide",
     ]
 
@@ -45,20 +73,19 @@ def render_slide(slide: SlideInfo, deck: Deck) -> Div:
         classes.extend(user_classes.split())
 
     style = ""
-    if slide.background:
-        bg = slide.background
-        if bg.startswith(("#", "rgb")):
+    if bg := meta.background:
+        if _BG_COLOR_RE.match(bg):
             style = f"background-color: {bg};"
         else:
             url = _resolve_asset_url(bg)
             style = f"background-image: url('{url}'); background-size: cover; background-position: center;"
 
-    if (cols := slide.frontmatter.get("cols")) and slide.layout == "grid":
+    if (cols := slide.frontmatter.get("cols")) and meta.layout == "grid":
         style += f" --grid-cols: {int(cols)};"
 
     image_url = slide.frontmatter.get("image")
 
-    if slide.layout in _IMAGE_LAYOUTS and image_url:
+    if meta.layout in _IMAGE_LAYOUTS and image_url:
         url = _resolve_asset_url(image_url)
         content = (
             f'<div class="slot-image" style="background-image: url(\'{url}\'); '
@@ -77,6 +104,22 @@ def render_slide(slide: SlideInfo, deck: Deck) -> Div:
     )
 
 
+def render_slide_xml(slide: SlideInfo, deck: Deck) -> str:
+    """Serialized form of render_slide for callers that need the HTML string."""
+    return _render_slide_xml(slide, deck.config)
+
+
+@lru_cache(maxsize=512)
+def _render_slide_xml(slide: SlideInfo, config: DeckConfig) -> str:
+    # Cache the string too, so repeat renders skip the to_xml tree walk
+    return to_xml(_render_slide(slide, config))
+
+
+def clear_render_cache() -> None:
+    _render_slide.cache_clear()
+    _render_slide_xml.cache_clear()
+
+
 def _grid_scaling_effect(root_cls: str):
     # CSS can't produce a unitless ratio from two lengths, so JS is needed
     return js(
@@ -10,6 +10,7 @@ from star_drawing import DrawingCanvas
 from starhtml import (
     Button,
     Div,
+    NotStr,
     Relay,
     ScriptEvent,
     Signal,
@@ -37,8 +38,10 @@ from stardeck.renderer import (
     VIEWBOX_WIDTH,
     build_grid_cards,
     build_grid_modal,
+    clear_render_cache,
     create_presenter_view,
     render_slide,
+    render_slide_xml,
 )
 from stardeck.themes import deck_hdrs, get_theme_bg, get_theme_color_scheme
 
@@ -65,16 +68,18 @@ async def _sse_stream(relay, initial_events=()):
 
 
 class FileWatcher:
-    def __init__(self, path: Path, on_change):
+    def __init__(self, path: Path, on_change, *, step_ms: int = 50):
         self.path = path.resolve()
         self.on_change = on_change
+        # awatch's batching window: how long it waits for further changes before yielding
+        self.step_ms = step_ms
         self._stop_event = asyncio.Event()
 
     async def start(self) -> None:
         from watchfiles import awatch
 
         self._stop_event.clear()
-        async for changes in awatch(self.path, stop_event=self._stop_event):
+        async for changes in awatch(self.path, step=self.step_ms, stop_event=self._stop_event):
             if any(Path(p) == self.path for _, p in changes):
                 self.on_change()
 
@@ -165,7 +170,13 @@ class AppState:
     watch: bool
     presentation: PresentationState
     presenter_token: str
+    theme: str = "default"
     watch_relay: Relay | None = field(default=None)
+    home_pages: dict[tuple[int, int], Div] = field(default_factory=dict)
+    audience_events: dict[tuple[int, int], tuple] = field(default_factory=dict)
+
+    def notify_file_change(self) -> None:
+        self.watch_relay.emit_signals({"file_version": int(time.time() * 1000)})
 
 
 def _yield_presenter_with_snapshot(pres):
@@ -202,6 +213,137 @@ def yield_presenter_updates(deck, slide_idx: int, clicks: int = 0, *, drawing_sn
         yield execute_script(_drawing_script("drawing-canvas", snapshot_json, clear=True))
 
 
+_HASH_NAV_JS = js("""
+    const hash = window.location.hash;
+    if (hash && hash.length > 1) {
+        const parts = hash.substring(1).split('.');
+        const slideNum = parseInt(parts[0], 10);
+        const clickNum = parts.length > 1 ? parseInt(parts[1], 10) : 0;
+        if (!isNaN(slideNum) && slideNum >= 1 && slideNum <= $total_slides) {
+            @get('/api/slide/' + (slideNum - 1) + '?clicks=' + clickNum)
+        }
+    }
+""")
+
+
+def render_home(state: AppState) -> Div:
+    """Audience page body for the current slide and clicks."""
+    # Home depends only on the deck and the current position; reuse the
+    # built page until either changes. Read the map before the deck: reload
+    # replaces the map only after the new deck is in place
+    pages = state.home_pages
+    pres = state.presentation
+    key = (pres.slide_index, pres.clicks)
+    if (page := pages.get(key)) is None:
+        page = pages[key] = _build_home(state)
+    return page
+
+
+def _build_home(state: AppState) -> Div:
+    pres, deck = state.presentation, state.deck
+    slide_index = Signal("slide_index", pres.slide_index)
+    total_slides = Signal("total_slides", deck.total)
+    clicks = Signal("clicks", pres.clicks)
+    max_clicks = Signal("max_clicks", pres.current_slide.max_clicks)
+    slide_scale = Signal("slide_scale", 1)
+    grid_open = Signal("grid_open", False)
+
+    vis_signals = build_click_signals(deck, clicks)
+
+    is_right = (evt.key == "ArrowRight") | (evt.key == " ")
+    is_left = evt.key == "ArrowLeft"
+    is_grid_key = (evt.key == "g") | (evt.key == "o")
+    is_esc = evt.key == "Escape"
+    not_grid = ~grid_open
+    can_click_fwd = clicks < max_clicks
+    can_click_back = clicks > 0
+
+    grid_cards = build_grid_cards(
+        deck,
+        slide_index,
+        grid_open,
+        lambda idx: f"/api/slide/{idx}",
+    )
+
+    return Div(
+        slide_index,
+        total_slides,
+        clicks,
+        max_clicks,
+        grid_open,
+        *vis_signals,
+        Span(data_on_load=get("/api/events"), style="display:none"),
+        Span(data_on_load=_HASH_NAV_JS, style="display:none"),
+        Span(data_on_hashchange=(_HASH_NAV_JS, {"window": True}), style="display:none"),
+        Div(
+            slide_scale,
+            Div(
+                Div(NotStr(render_slide_xml(pres.current_slide, deck)), id="slide-content"),
+                DrawingCanvas(
+                    readonly=True,
+                    id="audience-canvas",
+                    style="position:absolute;inset:0;width:100%;height:100%;pointer-events:none;z-index:100;",
+                    viewbox_width=VIEWBOX_WIDTH,
+                    viewbox_height=VIEWBOX_HEIGHT,
+                    theme=get_theme_color_scheme(state.theme),
+                ),
+                cls="slide-scaler",
+                data_attr_style="transform: translate(-50%, -50%) scale(" + slide_scale + ")",
+            ),
+            cls="slide-viewport",
+            data_resize=slide_scale.set((js("$resize_width") / SLIDE_WIDTH).min(js("$resize_height") / SLIDE_HEIGHT)),
+        ),
+        build_grid_modal(grid_cards, grid_open, "stardeck-root"),
+        Div(
+            Button(
+                "←",
+                cls="nav-btn",
+                data_on_click=can_click_back.if_(clicks.sub(1), get("/api/slide/prev")),
+                data_attr_disabled=slide_index == 0,
+            ),
+            Button(
+                data_text=slide_index + 1 + " / " + total_slides,
+                cls="slide-counter",
+                data_on_click=grid_open.toggle(),
+            ),
+            Button(
+                "→",
+                cls="nav-btn",
+                data_on_click=can_click_fwd.if_(clicks.add(1), get("/api/slide/next")),
+                data_attr_disabled=slide_index == total_slides - 1,
+            ),
+            cls="navigation-bar",
+        ),
+        Span(
+            data_on_keydown=(
+                [
+                    is_grid_key.then(seq(evt.preventDefault(), grid_open.toggle())),
+                    (is_esc & grid_open).then(seq(evt.preventDefault(), grid_open.set(False))),
+                    (not_grid & is_right).then(
+                        seq(
+                            evt.preventDefault(),
+                            can_click_fwd.if_(clicks.add(1), get("/api/slide/next")),
+                        )
+                    ),
+                    (not_grid & is_left).then(
+                        seq(
+                            evt.preventDefault(),
+                            can_click_back.if_(clicks.sub(1), get("/api/slide/prev")),
+                        )
+                    ),
+                ],
+                {"window": True},
+            ),
+            style="display:none",
+        ),
+        Span(data_effect=HASH_UPDATE_EFFECT, style="display:none"),
+        (file_version := Signal("file_version", 0)) if state.watch else None,
+        Span(data_on_load=get("/api/watch-events"), style="display:none") if state.watch else None,
+        Span(data_effect=(file_version > 0).then(get("/api/reload")), style="display:none") if state.watch else None,
+        cls="stardeck-root",
+    )
+
+
 def create_app(deck_path: Path, *, theme: str | None = None, watch: bool = False):
     deck_path = deck_path.resolve()
     has_clicks = deck_has_clicks(deck_path)
@@ -214,19 +356,17 @@ def create_app(deck_path: Path, *, theme: str | None = None, watch: bool = False
         watch=watch,
         presentation=PresentationState(initial_deck),
         presenter_token=presenter_token,
+        theme=theme,
     )
 
     watch_lifespan = None
     if watch:
         state.watch_relay = Relay()
 
-        def _on_file_change():
-            state.watch_relay.emit_signals({"file_version": int(time.time() * 1000)})
-
-        watcher = FileWatcher(deck_path, _on_file_change)
-
         @asynccontextmanager
         async def watch_lifespan(app):
+            # Built here so an app that is never served never touches the filesystem watcher
+            watcher = FileWatcher(deck_path, state.notify_file_change)
             task = asyncio.create_task(watcher.start())
             yield
             watcher.stop()
@@ -248,126 +388,9 @@ def create_app(deck_path: Path, *, theme: str | None = None, watch: bool = False
     if assets_dir.is_dir():
         app.register_package_static("deck_assets", str(assets_dir), "/assets")
 
-    hash_nav_js = js("""
-        const hash = window.location.hash;
-        if (hash && hash.length > 1) {
-            const parts = hash.substring(1).split('.');
-            const slideNum = parseInt(parts[0], 10);
-            const clickNum = parts.length > 1 ? parseInt(parts[1], 10) : 0;
-            if (!isNaN(slideNum) && slideNum >= 1 && slideNum <= $total_slides) {
-                @get('/api/slide/' + (slideNum - 1) + '?clicks=' + clickNum)
-            }
-        }
-    """)
-
     @rt("/")
     def home():
-        pres = state.presentation
-        deck = state.deck
-
-        slide_index = Signal("slide_index", pres.slide_index)
-        total_slides = Signal("total_slides", deck.total)
-        clicks = Signal("clicks", pres.clicks)
-        max_clicks = Signal("max_clicks", pres.current_slide.max_clicks)
-        slide_scale = Signal("slide_scale", 1)
-        grid_open = Signal("grid_open", False)
-
-        vis_signals = build_click_signals(deck, clicks)
-
-        is_right = (evt.key == "ArrowRight") | (evt.key == " ")
-        is_left = evt.key == "ArrowLeft"
-        is_grid_key = (evt.key == "g") | (evt.key == "o")
-        is_esc = evt.key == "Escape"
-        not_grid = ~grid_open
-        can_click_fwd = clicks < max_clicks
-        can_click_back = clicks > 0
-
-        grid_cards = build_grid_cards(
-            deck,
-            slide_index,
-            grid_open,
-            lambda idx: f"/api/slide/{idx}",
-        )
-
-        return Div(
-            slide_index,
-            total_slides,
-            clicks,
-            max_clicks,
-            grid_open,
-            *vis_signals,
-            Span(data_on_load=get("/api/events"), style="display:none"),
-            Span(data_on_load=hash_nav_js, style="display:none"),
-            Span(data_on_hashchange=(hash_nav_js, {"window": True}), style="display:none"),
-            Div(
-                slide_scale,
-                Div(
-                    Div(render_slide(pres.current_slide, deck), id="slide-content"),
-                    DrawingCanvas(
-                        readonly=True,
-                        id="audience-canvas",
-                        style="position:absolute;inset:0;width:100%;height:100%;pointer-events:none;z-index:100;",
-                        viewbox_width=VIEWBOX_WIDTH,
-                        viewbox_height=VIEWBOX_HEIGHT,
-                        theme=get_theme_color_scheme(theme),
-                    ),
-                    cls="slide-scaler",
-                    data_attr_style="transform: translate(-50%, -50%) scale(" + slide_scale + ")",
-                ),
-                cls="slide-viewport",
-                data_resize=slide_scale.set(
-                    (js("$resize_width") / SLIDE_WIDTH).min(js("$resize_height") / SLIDE_HEIGHT)
-                ),
-            ),
-            build_grid_modal(grid_cards, grid_open, "stardeck-root"),
-            Div(
-                Button(
-                    "←",
-                    cls="nav-btn",
-                    data_on_click=can_click_back.if_(clicks.sub(1), get("/api/slide/prev")),
-                    data_attr_disabled=slide_index == 0,
-                ),
-                Button(
-                    data_text=slide_index + 1 + " / " + total_slides,
-                    cls="slide-counter",
-                    data_on_click=grid_open.toggle(),
-                ),
-                Button(
-                    "→",
-                    cls="nav-btn",
-                    data_on_click=can_click_fwd.if_(clicks.add(1), get("/api/slide/next")),
-                    data_attr_disabled=slide_index == total_slides - 1,
-                ),
-                cls="navigation-bar",
-            ),
-            Span(
-                data_on_keydown=(
-                    [
-                        is_grid_key.then(seq(evt.preventDefault(), grid_open.toggle())),
-                        (is_esc & grid_open).then(seq(evt.preventDefault(), grid_open.set(False))),
-                        (not_grid & is_right).then(
-                            seq(
-                                evt.preventDefault(),
-                                can_click_fwd.if_(clicks.add(1), get("/api/slide/next")),
-                            )
-                        ),
-                        (not_grid & is_left).then(
-                            seq(
-                                evt.preventDefault(),
-                                can_click_back.if_(clicks.sub(1), get("/api/slide/prev")),
-                            )
-                        ),
-                    ],
-                    {"window": True},
-                ),
-                style="display:none",
-            ),
-            Span(data_effect=HASH_UPDATE_EFFECT, style="display:none"),
-            (file_version := Signal("file_version", 0)) if watch else None,
-            Span(data_on_load=get("/api/watch-events"), style="display:none") if watch else None,
-            Span(data_effect=(file_version > 0).then(get("/api/reload")), style="display:none") if watch else None,
-            cls="stardeck-root",
-        )
+        return render_home(state)
 
     @rt("/presenter")
     def presenter(token: str = ""):
@@ -431,17 +454,24 @@ def create_app(deck_path: Path, *, theme: str | None = None, watch: bool = False
         pres.apply_and_broadcast_changes(slide_index, changes)
         return JSONResponse({"ok": True, "applied": len(changes)})
 
+    def _audience_events(idx: int, clicks: int = 0) -> tuple:
+        # Audience updates depend only on the deck and the clamped target, so
+        # each (idx, clicks) is built once per deck; map before deck, as in render_home
+        events_map = state.audience_events
+        key = (idx, clicks)
+        if (events := events_map.get(key)) is None:
+            events = events_map[key] = tuple(yield_audience_updates(state.deck, idx, clicks))
+        return events
+
     @rt("/api/slide/next")
     @sse
     def next_slide(slide_index: int = 0):
-        current_deck = state.deck
-        yield from yield_audience_updates(current_deck, min(slide_index + 1, current_deck.total - 1))
+        yield from _audience_events(min(slide_index + 1, state.deck.total - 1))
 
     @rt("/api/slide/prev")
     @sse
     def prev_slide(slide_index: int = 0):
-        current_deck = state.deck
-        yield from yield_audience_updates(current_deck, max(slide_index - 1, 0))
+        yield from _audience_events(max(slide_index - 1, 0))
 
     @rt("/api/slide/{idx}")
     @sse
@@ -449,7 +479,7 @@ def create_app(deck_path: Path, *, theme: str | None = None, watch: bool = False
         current_deck = state.deck
         idx = max(0, min(idx, current_deck.total - 1))
         clicks = max(0, min(clicks, current_deck.slides[idx].max_clicks))
-        yield from yield_audience_updates(current_deck, idx, clicks)
+        yield from _audience_events(idx, clicks)
 
     def _signal_deps(deck):
         mc = max((s.max_clicks for s in deck.slides), default=0)
@@ -460,10 +490,14 @@ def create_app(deck_path: Path, *, theme: str | None = None, watch: bool = False
     @sse
     def reload_deck(slide_index: int = 0):
         old_mc, old_ranges = _signal_deps(state.deck)
-        use_motion = deck_has_clicks(state.path)
-        current_deck = parse_deck(state.path, use_motion=use_motion)
-        state.deck = current_deck
+        current_deck = parse_deck(state.path, use_motion=deck_has_clicks(state.path))
+        clear_render_cache()
+        # New deck everywhere first, fresh cache maps last; a handler still
+        # holding an old map only writes into one that is being discarded
         state.presentation.reload_deck(current_deck)
+        state.deck = current_deck
+        state.home_pages = {}
+        state.audience_events = {}
         new_mc, new_ranges = _signal_deps(current_deck)
 
         if new_mc > old_mc or new_ranges - old_ranges:
@@ -472,7 +506,7 @@ def create_app(deck_path: Path, *, theme: str | None = None, watch: bool = False
 
         idx = min(slide_index, current_deck.total - 1)
         yield signals(total_slides=current_deck.total)
-        yield from yield_audience_updates(current_deck, idx)
+        yield from _audience_events(idx)
 
     @rt("/api/watch-events")
     async def watch_events():
@@ -1,13 +1,18 @@
 """StarDeck theme system — CSS themes live in your codebase and can be customized."""
 
+from functools import cache
 from importlib import import_module, resources
 from pathlib import Path
 
 _THEMES_DIR = Path(__file__).parent
 
 
+@cache
 def get_theme_css(theme_name: str = "default") -> str:
-    """Load CSS for a theme by name. Raises FileNotFoundError if missing."""
+    """Load CSS for a theme by name. Raises FileNotFoundError if missing.
+
+    Read once per process; every app and export shares the same string.
+    """
     try:
         return resources.files(f"stardeck.themes.{theme_name}").joinpath("styles.css").read_text()
     except (ModuleNotFoundError, FileNotFoundError, TypeError):
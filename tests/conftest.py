@@ -1,18 +1,33 @@
 """Shared test fixtures and helpers."""
 
-import json
+import contextlib
+import copy
 import re
+from functools import cache, lru_cache
 from pathlib import Path
 
 import pytest
 from starlette.testclient import TestClient
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
-def parse_sse_signals(text: str) -> dict:
+_SSE_SIGNALS_RE = re.compile(rb"^data:[ \t]*signals[ \t]+(\{[^\r\n]*\})\r?$", re.M)
+
+
+def parse_sse_signals(text: str | bytes) -> dict:
     """Extract merged signal dict from SSE `data: signals {...}` lines."""
+    # Copy so callers can't mutate the cached result
+    return dict(_parse_sse_signals(text.encode() if isinstance(text, str) else text))
+
+
+@lru_cache(maxsize=256)
+def _parse_sse_signals(body: bytes) -> dict:
     merged = {}
-    for m in re.finditer(r"data:\s*signals\s+(\{.*?\})", text):
-        merged.update(json.loads(m.group(1)))
+    for m in _SSE_SIGNALS_RE.finditer(body):
+        merged.update(_loads(m.group(1)))
     return merged
 
 
@@ -23,10 +38,104 @@ def mk_deck(tmp_path: Path, text: str) -> Path:
     return md
 
 
+THREE_SLIDES = "# Slide 1\n---\n# Slide 2\n---\n# Slide 3"
+
+
+@pytest.fixture(scope="session")
+def app_factory(tmp_path_factory):
+    """Build each (markdown, watch) app once per session → (app, rt, deck_state, client).
+
+    Shared across tests, so only use it for requests that leave deck_state untouched.
+    Non-watch clients are entered once, so every request reuses one portal thread;
+    watch clients aren't, so their lifespan (and the real file watcher) never starts.
+    """
+    from stardeck.server import create_app
+
+    with contextlib.ExitStack() as stack:
+
+        @cache
+        def build(text: str, watch: bool):
+            md = mk_deck(tmp_path_factory.mktemp("deck"), text)
+            app, rt, deck_state = create_app(md, watch=watch)
+            client = TestClient(app) if watch else stack.enter_context(TestClient(app))
+            return app, rt, deck_state, client
+
+        # Normalize the keyword so app_factory(t) and app_factory(t, watch=False) share one app
+        def make(text: str, *, watch: bool = False):
+            return build(text, watch)
+
+        yield make
+
+
+@pytest.fixture
+def mutable_app_factory(app_factory):
+    """app_factory for tests that move the shared presentation or draw on it.
+
+    Position and drawings are snapshotted on first use and restored at teardown.
+    """
+    snapshots = {}
+
+    def make(text: str, *, watch: bool = False):
+        built = app_factory(text, watch=watch)
+        pres = built[2].presentation
+        if id(pres) not in snapshots:
+            snapshots[id(pres)] = (pres, pres.slide_index, pres.clicks, copy.deepcopy(pres.drawing))
+        return built
+
+    yield make
+    for pres, slide_index, clicks, drawing in snapshots.values():
+        pres.slide_index, pres.clicks, pres.drawing = slide_index, clicks, drawing
+
+
+@pytest.fixture(scope="session")
+def parsed_deck(tmp_path_factory):
+    """parse_deck result for a markdown body, parsed once per session. Treat as read-only."""
+    from stardeck.parser import parse_deck
+
+    @cache
+    def get(text: str):
+        return parse_deck(mk_deck(tmp_path_factory.mktemp("parsed"), text))
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def home_html(app_factory):
+    """Audience page body for a (markdown, watch) deck, rendered once per session without a request."""
+    from stardeck.server import render_home
+    from starhtml import to_xml
+
+    @cache
+    def get(text: str, *, watch: bool = False) -> str:
+        return to_xml(render_home(app_factory(text, watch=watch)[2]))
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def default_client(app_factory) -> TestClient:
+    """Shared client for read-only requests against the 3-slide deck."""
+    return app_factory(THREE_SLIDES)[3]
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Backend for anyio-marked tests; session-scoped so they share one runner."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="module")
+def deck_file(tmp_path_factory) -> Path:
+    """One slides.md per module for tests that build their own app and rewrite the deck in place."""
+    path = tmp_path_factory.mktemp("deck_file") / "slides.md"
+    path.touch()
+    return path
+
+
 @pytest.fixture
 def deck_path(tmp_path: Path) -> Path:
     """3-slide deck with no clicks."""
-    return mk_deck(tmp_path, "# Slide 1\n---\n# Slide 2\n---\n# Slide 3")
+    return mk_deck(tmp_path, THREE_SLIDES)
 
 
 @pytest.fixture
@@ -40,9 +149,10 @@ def app_and_state(deck_path: Path):
 
 @pytest.fixture
 def client(app_and_state) -> TestClient:
-    """TestClient wrapping the app."""
+    """TestClient wrapping the app; entered so all of a test's requests share one portal."""
     app, _ = app_and_state
-    return TestClient(app)
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture
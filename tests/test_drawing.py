@@ -2,28 +2,28 @@
 
 from pathlib import Path
 
+from stardeck.models import DrawingStore
+from stardeck.server import create_app
 from starlette.testclient import TestClient
 
 
-def test_audience_has_drawing_canvas(client):
+def test_audience_has_drawing_canvas(default_client: TestClient):
     """Audience view should contain a readonly drawing-canvas component."""
-    response = client.get("/")
+    response = default_client.get("/")
     assert response.status_code == 200
     assert "audience-canvas" in response.text
     assert "drawing-canvas" in response.text
 
 
-def test_drawing_canvas_is_readonly(client):
+def test_drawing_canvas_is_readonly(default_client: TestClient):
     """Audience canvas should have readonly attribute."""
-    response = client.get("/")
+    response = default_client.get("/")
     assert response.status_code == 200
     assert "readonly" in response.text
 
 
 def test_drawing_store_apply_and_snapshot():
     """DrawingStore should apply changes and return snapshots."""
-    from stardeck.models import DrawingStore
-
     store = DrawingStore()
     changes = [
         {"type": "create", "element": {"id": "el-1", "kind": "pen", "points": []}},
@@ -40,8 +40,6 @@ def test_drawing_store_apply_and_snapshot():
 
 def test_drawing_store_delete():
     """DrawingStore should handle delete changes."""
-    from stardeck.models import DrawingStore
-
     store = DrawingStore()
     store.apply_changes(
         0,
@@ -59,8 +57,6 @@ def test_drawing_store_delete():
 
 def test_drawing_store_update():
     """DrawingStore should handle update changes."""
-    from stardeck.models import DrawingStore
-
     store = DrawingStore()
     store.apply_changes(
         0,
@@ -82,8 +78,6 @@ def test_drawing_store_update():
 
 def test_drawing_store_multiple_slides():
     """DrawingStore should keep elements separated by slide."""
-    from stardeck.models import DrawingStore
-
     store = DrawingStore()
     store.apply_changes(0, [{"type": "create", "element": {"id": "el-1"}}])
     store.apply_changes(1, [{"type": "create", "element": {"id": "el-2"}}])
@@ -96,8 +90,6 @@ def test_drawing_store_multiple_slides():
 
 def test_drawing_store_reorder():
     """DrawingStore should reorder elements and filter out deleted IDs."""
-    from stardeck.models import DrawingStore
-
     store = DrawingStore()
     store.apply_changes(
         0,
@@ -122,8 +114,6 @@ def test_drawing_store_reorder():
 
 def test_drawing_store_empty_snapshot():
     """DrawingStore should return empty list for slides with no drawings."""
-    from stardeck.models import DrawingStore
-
     store = DrawingStore()
     assert store.get_snapshot(0) == []
     assert store.get_snapshot(999) == []
@@ -131,9 +121,6 @@ def test_drawing_store_empty_snapshot():
 
 def test_presentation_state_has_drawing_store(tmp_path: Path):
     """PresentationState should include DrawingStore."""
-    from stardeck.models import DrawingStore
-    from stardeck.server import create_app
-
     md_file = tmp_path / "slides.md"
     md_file.write_text("# Slide 1")
 
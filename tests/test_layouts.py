@@ -3,7 +3,7 @@
 from pathlib import Path
 
 from stardeck.models import Deck, DeckConfig, SlideInfo
-from stardeck.parser import transform_regions
+from stardeck.parser import parse_deck, transform_regions
 from stardeck.renderer import render_slide
 from starhtml import to_xml
 
@@ -189,8 +189,6 @@ def test_layout_css_classes_exist():
 
 
 def test_parse_deck_regions_and_clicks(tmp_path):
-    from stardeck.parser import parse_deck
-
     md = tmp_path / "slides.md"
     md.write_text(
         "---\nlayout: two-cols\n---\n<left>\n\n## Left\n\n</left>\n\n<right>\n\n<click>Reveal</click>\n\n</right>"
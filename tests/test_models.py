@@ -1,6 +1,6 @@
 """Tests for stardeck models."""
 
-from stardeck.models import Deck, DeckConfig, SlideInfo
+from stardeck.models import Deck, DeckConfig, SlideInfo, SlideMeta
 
 
 def test_slide_info_basic():
@@ -29,6 +29,22 @@ def test_slide_info_background():
     assert slide.background == "./stars.jpg"
 
 
+def test_slide_info_hashable_with_frontmatter():
+    a = SlideInfo(content="<h1>Hi</h1>", index=0, frontmatter={"layout": "cover", "tags": ["a", "b"]})
+    b = SlideInfo(content="<h1>Hi</h1>", index=0, frontmatter={"layout": "cover", "tags": ["a", "b"]})
+    c = SlideInfo(content="<h1>Hi</h1>", index=0, frontmatter={"layout": "grid"})
+    assert hash(a) == hash(b)
+    assert len({a, b, c}) == 2
+
+
+def test_slide_info_hash_ignores_set_order():
+    # {1, 9} and {9, 1} collide in the set table, so they iterate in insertion order
+    a = SlideInfo(content="<h1>Hi</h1>", index=0, frontmatter={"tags": {1, 9}})
+    b = SlideInfo(content="<h1>Hi</h1>", index=0, frontmatter={"tags": {9, 1}})
+    assert a == b
+    assert hash(a) == hash(b)
+
+
 def test_slide_info_frozen():
     slide = SlideInfo(content="<h1>Hi</h1>", index=0)
     try:
@@ -76,3 +92,9 @@ def test_slide_info_has_max_clicks():
 def test_slide_info_max_clicks_defaults_to_zero():
     slide = SlideInfo(content="<p>Hello</p>", index=0)
     assert slide.max_clicks == 0
+
+
+def test_slide_meta_resolved_from_frontmatter():
+    slide = SlideInfo(content="", index=0, frontmatter={"layout": "cover", "background": "#000"})
+    assert slide.meta == SlideMeta(layout="cover", transition=None, background="#000")
+    assert SlideInfo(content="", index=0).meta == SlideMeta()
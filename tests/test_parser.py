@@ -3,6 +3,7 @@
 from stardeck.parser import (
     ClickDefaults,
     ClickResult,
+    deck_has_clicks,
     extract_notes,
     parse_deck,
     parse_frontmatter,
@@ -62,6 +63,12 @@ layout: cover
     assert "Cover Slide" in result[1]
 
 
+def test_split_slides_trailing_delimiter():
+    assert split_slides("# Slide 1\n---") == ["# Slide 1"]
+    assert split_slides("# Slide 1\n---\n") == ["# Slide 1", ""]
+    assert split_slides("---\n# Slide 1") == ["# Slide 1"]
+
+
 def test_parse_frontmatter():
     raw = "---\nlayout: cover\n---\n# Title"
     fm, content = parse_frontmatter(raw)
@@ -669,3 +676,36 @@ def test_clicks_wrapper_skips_code():
     result = transform_clicks_wrapper(content)
     assert "`<clicks>`" in result
     assert result.count("<click>") == 2
+
+
+def test_code_fence_highlighting(tmp_path):
+    """Known languages are highlighted; unknown ones fall back to plain text."""
+    md_file = tmp_path / "slides.md"
+    md_file.write_text("```python\ndef f(): pass\n```\n---\n```nosuchlang\ndef f(): pass\n```")
+    deck = parse_deck(md_file)
+    assert 'class="language-python"' in deck.slides[0].content
+    assert "<span" in deck.slides[0].content
+    assert 'class="language-nosuchlang"' in deck.slides[1].content
+    assert "<span" not in deck.slides[1].content
+
+
+def test_code_fence_extension_language(tmp_path):
+    """Fence info naming a file extension resolves to that language's lexer."""
+    md_file = tmp_path / "slides.md"
+    md_file.write_text("```example.py\ndef f(): pass\n```")
+    deck = parse_deck(md_file)
+    assert "<span" in deck.slides[0].content
+
+
+def test_deck_has_clicks(tmp_path):
+    md_file = tmp_path / "slides.md"
+    for text, expected in [
+        ("# A\n<click>x</click>", True),
+        ("# A\n<after>x</after>", True),
+        ('# A\n<clicks every="1">x</clicks>', True),
+        ("# A\n<click\n  at=2>x</click>", True),
+        ("# A\n<clickable>x</clickable>", False),
+        ("# A\nno clicks here", False),
+    ]:
+        md_file.write_text(text)
+        assert deck_has_clicks(md_file) is expected, text
@@ -1,10 +1,9 @@
 """Tests for the StarDeck presenter mode."""
 
-from pathlib import Path
-
+import pytest
 from starlette.testclient import TestClient
 
-from .conftest import mk_deck
+pytestmark = pytest.mark.presenter
 
 
 def test_presenter_route_exists(client: TestClient, presenter_token: str):
@@ -13,8 +12,8 @@ def test_presenter_route_exists(client: TestClient, presenter_token: str):
     assert "presenter" in response.text.lower()
 
 
-def test_presenter_requires_token(client: TestClient):
-    response = client.get("/presenter")
+def test_presenter_requires_token(default_client: TestClient):
+    response = default_client.get("/presenter")
     assert response.status_code == 200
     assert "Access Denied" in response.text
 
@@ -34,13 +33,9 @@ def test_presenter_has_next_slide_preview(client: TestClient, presenter_token: s
     assert "presenter-next" in html or "next-slide" in html
 
 
-def test_presenter_shows_speaker_notes(tmp_path: Path):
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# Slide 1\n\n<!-- notes\nThese are my speaker notes.\n-->")
-    app, _rt, deck_state = create_app(md_file)
-    token = deck_state.presenter_token
-    html = TestClient(app).get(f"/presenter?token={token}").text
+def test_presenter_shows_speaker_notes(app_factory):
+    _app, _rt, deck_state, client = app_factory("# Slide 1\n\n<!-- notes\nThese are my speaker notes.\n-->")
+    html = client.get(f"/presenter?token={deck_state.presenter_token}").text
     assert "These are my speaker notes" in html
 
 
@@ -1,73 +1,102 @@
+import pytest
 from stardeck.models import Deck, DeckConfig, SlideInfo
-from stardeck.renderer import render_slide
-from starhtml import to_xml
+from stardeck.renderer import clear_render_cache, render_slide, render_slide_xml
 
 
-def _slide(content="<h1>Hi</h1>", index=0, frontmatter=None):
-    return SlideInfo(content=content, index=index, frontmatter=frontmatter or {})
+@pytest.fixture(scope="module")
+def base_deck() -> Deck:
+    """Default-config deck; rendering only reads deck.config, so slides stay empty."""
+    return Deck(slides=[], config=DeckConfig())
 
 
-def _deck(slide, **config_kw):
-    return Deck(slides=[slide], config=DeckConfig(**config_kw))
+@pytest.fixture(scope="module")
+def zoom_deck() -> Deck:
+    return Deck(slides=[], config=DeckConfig(transition="zoom"))
 
 
-def _render(slide, **config_kw):
-    return to_xml(render_slide(slide, _deck(slide, **config_kw)))
+@pytest.fixture(scope="module")
+def slide_factory():
+    def make(content="<h1>Hi</h1>", index=0, frontmatter=None):
+        return SlideInfo(content=content, index=index, frontmatter=frontmatter or {})
 
+    return make
 
-def test_render_slide():
-    result = _render(_slide())
+
+def test_render_slide(base_deck, slide_factory):
+    result = render_slide_xml(slide_factory(), base_deck)
     assert "slide-0" in result
     assert "layout-default" in result
 
 
-def test_render_slide_with_layout():
-    result = _render(_slide(frontmatter={"layout": "cover"}))
+def test_render_slide_with_layout(base_deck, slide_factory):
+    result = render_slide_xml(slide_factory(frontmatter={"layout": "cover"}), base_deck)
     assert "layout-cover" in result
 
 
-def test_render_slide_with_background_image():
-    result = _render(_slide(content="<h1>Title</h1>", frontmatter={"background": "./stars.jpg"}))
+def test_render_slide_with_background_image(base_deck, slide_factory):
+    result = render_slide_xml(
+        slide_factory(content="<h1>Title</h1>", frontmatter={"background": "./stars.jpg"}), base_deck
+    )
     assert "background-image" in result
     assert "stars.jpg" in result
 
 
-def test_render_slide_with_background_color():
-    result = _render(_slide(content="<h1>Title</h1>", frontmatter={"background": "#2563eb"}))
+def test_render_slide_with_background_color(base_deck, slide_factory):
+    result = render_slide_xml(slide_factory(content="<h1>Title</h1>", frontmatter={"background": "#2563eb"}), base_deck)
     assert "background-color" in result
     assert "#2563eb" in result
 
 
-def test_render_slide_has_id():
-    result = _render(_slide(index=3))
+def test_render_slide_has_id(base_deck, slide_factory):
+    result = render_slide_xml(slide_factory(index=3), base_deck)
     assert 'id="slide-3"' in result
 
 
-def test_render_slide_has_data_slide_index():
-    result = _render(_slide(index=5))
+def test_render_slide_has_data_slide_index(base_deck, slide_factory):
+    result = render_slide_xml(slide_factory(index=5), base_deck)
     assert 'data-slide-index="5"' in result
 
 
-def test_render_slide_has_transition_class():
-    result = _render(_slide(frontmatter={"transition": "slide-left"}))
+def test_render_slide_has_transition_class(base_deck, slide_factory):
+    result = render_slide_xml(slide_factory(frontmatter={"transition": "slide-left"}), base_deck)
     assert "transition-slide-left" in result
 
 
-def test_render_slide_uses_deck_transition_fallback():
-    result = _render(_slide(), transition="zoom")
+def test_render_slide_uses_deck_transition_fallback(zoom_deck, slide_factory):
+    result = render_slide_xml(slide_factory(), zoom_deck)
     assert "transition-zoom" in result
 
 
-def test_render_slide_transition_slide_right():
-    result = _render(_slide(frontmatter={"transition": "slide-right"}))
+def test_render_slide_transition_slide_right(base_deck, slide_factory):
+    result = render_slide_xml(slide_factory(frontmatter={"transition": "slide-right"}), base_deck)
     assert "transition-slide-right" in result
 
 
-def test_render_slide_transition_slide_up():
-    result = _render(_slide(frontmatter={"transition": "slide-up"}))
+def test_render_slide_transition_slide_up(base_deck, slide_factory):
+    result = render_slide_xml(slide_factory(frontmatter={"transition": "slide-up"}), base_deck)
     assert "transition-slide-up" in result
 
 
-def test_render_slide_transition_slide_down():
-    result = _render(_slide(frontmatter={"transition": "slide-down"}))
+def test_render_slide_transition_slide_down(base_deck, slide_factory):
+    result = render_slide_xml(slide_factory(frontmatter={"transition": "slide-down"}), base_deck)
     assert "transition-slide-down" in result
+
+
+def test_render_slide_cached_per_slide_and_config(base_deck, zoom_deck, slide_factory):
+    slide = slide_factory()
+    assert render_slide(slide, base_deck) is render_slide(slide, Deck(slides=[slide], config=DeckConfig()))
+    assert render_slide(slide, base_deck) is not render_slide(slide, zoom_deck)
+
+
+def test_render_slide_xml_cached_until_cleared(base_deck, slide_factory):
+    slide = slide_factory(index=7)
+    first = render_slide_xml(slide, base_deck)
+    assert render_slide_xml(slide, base_deck) is first
+    clear_render_cache()
+    assert render_slide_xml(slide, base_deck) == first
+
+
+def test_render_slide_with_background_css_color_functions(base_deck, slide_factory):
+    for bg in ("rgb(37, 99, 235)", "hsl(220 80% 50%)", "transparent"):
+        result = render_slide_xml(slide_factory(frontmatter={"background": bg}), base_deck)
+        assert f"background-color: {bg}" in result
@@ -1,261 +1,232 @@
 """Tests for the StarDeck server module."""
 
+import asyncio
+import json
+from functools import cache
 from pathlib import Path
 
+import pytest
+from stardeck.server import create_app, yield_presenter_updates
+from starhtml import format_event, to_xml
 from starlette.testclient import TestClient
 
-from .conftest import mk_deck, parse_sse_signals
+from .conftest import THREE_SLIDES, mk_deck, parse_sse_signals
 
 
-def test_create_app(tmp_path: Path):
+def test_create_app(app_factory):
     """Test that create_app returns app, rt, and deck_state tuple."""
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# Test Slide")
-    app, rt, deck_state = create_app(md_file)
+    app, rt, deck_state, _client = app_factory("# Test Slide")
 
     assert deck_state.deck.total == 1
     assert app is not None
     assert rt is not None
 
 
-def test_next_slide_endpoint(client: TestClient):
-    """Advancing from slide 0 yields slide_index == 1."""
-    response = client.get("/api/slide/next?slide_index=0")
-    sigs = parse_sse_signals(response.text)
-    assert sigs["slide_index"] == 1
-
-
-def test_prev_slide_endpoint(client: TestClient):
-    """Going prev from slide 2 yields slide_index == 1."""
-    response = client.get("/api/slide/prev?slide_index=2")
-    sigs = parse_sse_signals(response.text)
-    assert sigs["slide_index"] == 1
-
-
-def test_goto_slide_endpoint(client: TestClient):
-    """Goto slide 2 yields slide_index == 2."""
-    response = client.get("/api/slide/2")
-    sigs = parse_sse_signals(response.text)
-    assert sigs["slide_index"] == 2
+@pytest.mark.parametrize(
+    ("path", "slide_index"),
+    [
+        ("/api/slide/next?slide_index=0", 1),
+        ("/api/slide/prev?slide_index=2", 1),
+        ("/api/slide/2", 2),
+        ("/api/slide/1", 1),
+    ],
+)
+def test_sse_endpoints(default_client: TestClient, path, slide_index):
+    """Each endpoint streams SSE; next/prev/goto land on the expected slide with clicks reset to 0."""
+    response = default_client.get(path)
+    assert response.status_code == 200
+    assert "text/event-stream" in response.headers["content-type"]
+    sigs = parse_sse_signals(response.content)
+    assert sigs["slide_index"] == slide_index
+    assert sigs["clicks"] == 0
 
 
-def test_reload_endpoint(client: TestClient):
-    """Reload returns SSE with re-parsed deck."""
+def test_reload_endpoint_streams(client: TestClient):
+    # Reload swaps the deck and drops cached pages, so it stays off the shared session app
     response = client.get("/api/reload")
     assert response.status_code == 200
     assert "text/event-stream" in response.headers["content-type"]
 
 
-def test_watch_creates_relay(tmp_path: Path):
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# Test Slide")
-    _app, _rt, deck_state = create_app(md_file, watch=True)
-    assert deck_state.watch_relay is not None
-
-
-def test_watch_home_has_sse_elements(tmp_path: Path):
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# Test Slide")
-    app, _rt, _state = create_app(md_file, watch=True)
-    html = TestClient(app).get("/").text
-    assert "file_version" in html
-    assert "watch-events" in html
-
+@pytest.fixture(scope="module")
+def watch_app(app_factory):
+    """The shared watch-mode app → (app, rt, deck_state, client); its lifespan never runs."""
+    return app_factory("# Test Slide", watch=True)
 
-def test_watch_disabled_no_sse_elements(tmp_path: Path):
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# Test Slide")
-    app, _rt, _state = create_app(md_file, watch=False)
-    html = TestClient(app).get("/").text
-    assert "file_version" not in html
-    assert "watch-events" not in html
 
+@pytest.mark.watch
+def test_watch_creates_relay(watch_app):
+    _app, _rt, deck_state, _client = watch_app
+    assert deck_state.watch_relay is not None
 
-def test_watch_events_disabled_without_watch(tmp_path: Path):
-    from stardeck.server import create_app
 
-    md_file = mk_deck(tmp_path, "# Test Slide")
-    app, _rt, _state = create_app(md_file, watch=False)
-    response = TestClient(app).get("/api/watch-events")
+@pytest.mark.watch
+def test_watch_defers_file_watcher_to_lifespan(tmp_path: Path, monkeypatch):
+    """Building a watch app only sets up the relay; the watcher starts with the server."""
+    built = []
+    monkeypatch.setattr("stardeck.server.FileWatcher", lambda *args: built.append(args))
+    _app, _rt, state = create_app(mk_deck(tmp_path, "# S1"), watch=True)
+    assert state.watch_relay is not None
+    assert built == []
+
+
+@pytest.mark.watch
+@pytest.mark.anyio
+async def test_watch_file_change_emits_file_version(watch_app, monkeypatch):
+    state = watch_app[2]
+    now = [1_700_000_000.0]
+    monkeypatch.setattr("stardeck.server.time.time", lambda: now[0])
+    queue = state.watch_relay.subscribe()
+    try:
+        state.notify_file_change()
+        now[0] += 1.0
+        state.notify_file_change()
+        first = format_event(await asyncio.wait_for(queue.get(), 1))
+        second = format_event(await asyncio.wait_for(queue.get(), 1))
+    finally:
+        state.watch_relay.unsubscribe(queue)
+    # Versions come straight from the patched clock, so they're exact and strictly increasing
+    assert parse_sse_signals(first) == {"file_version": 1_700_000_000_000}
+    assert parse_sse_signals(second) == {"file_version": 1_700_000_001_000}
+
+
+@pytest.mark.watch
+@pytest.mark.parametrize("needle", ["file_version", "watch-events"])
+def test_watch_home_has_sse_elements(home_html, needle):
+    assert needle in home_html("# Test Slide", watch=True)
+
+
+@pytest.mark.watch
+@pytest.mark.parametrize("needle", ["file_version", "watch-events"])
+def test_watch_disabled_no_sse_elements(home_html, needle):
+    assert needle not in home_html("# Test Slide")
+
+
+@pytest.mark.watch
+def test_watch_events_disabled_without_watch(default_client: TestClient):
+    response = default_client.get("/api/watch-events")
     assert response.status_code == 404
 
 
-def test_home_has_clicks_signal(client: TestClient):
-    html = client.get("/").text
-    assert "clicks" in html
-    assert "data-signals" in html
-
-
-def test_keyboard_navigation_with_clicks(client: TestClient):
-    html = client.get("/").text
-    assert "$clicks<$max_clicks" in html or "$clicks < $max_clicks" in html
-
-
-def test_next_slide_resets_clicks(client: TestClient):
-    """Next slide SSE response has clicks == 0."""
-    sigs = parse_sse_signals(client.get("/api/slide/next?slide_index=0").text)
-    assert sigs["clicks"] == 0
-
-
-def test_prev_slide_resets_clicks(client: TestClient):
-    """Prev from slide 2 yields slide_index 1, clicks 0."""
-    sigs = parse_sse_signals(client.get("/api/slide/prev?slide_index=2").text)
-    assert sigs["slide_index"] == 1
-    assert sigs["clicks"] == 0
-
-
-def test_goto_slide_resets_clicks(client: TestClient):
-    """Goto slide 1 resets clicks to 0."""
-    sigs = parse_sse_signals(client.get("/api/slide/1").text)
-    assert sigs["clicks"] == 0
-
-
-def test_url_hash_effect_present(client: TestClient):
-    """Hash update effect JS is present in home page."""
-    html = client.get("/").text
-    assert "history.replaceState" in html
-    assert "$clicks" in html
-
-
-def test_goto_slide_accepts_clicks_param(client: TestClient):
+@pytest.mark.parametrize(
+    "needles",
+    [
+        ("clicks",),
+        ("data-signals",),
+        # Keyboard navigation steps clicks before slides
+        ("$clicks<$max_clicks", "$clicks < $max_clicks"),
+        # URL hash update effect
+        ("history.replaceState",),
+        ("$clicks",),
+    ],
+)
+def test_home_click_navigation(home_html, needles):
+    """The home page carries the clicks signal, keyboard stepping and hash effect; any needle may match."""
+    html = home_html(THREE_SLIDES)
+    assert any(needle in html for needle in needles)
+
+
+def test_goto_slide_accepts_clicks_param(default_client: TestClient):
     """Goto with clicks param passes the value through."""
-    sigs = parse_sse_signals(client.get("/api/slide/1?clicks=0").text)
+    sigs = parse_sse_signals(default_client.get("/api/slide/1?clicks=0").content)
     assert sigs["clicks"] == 0
 
 
-def test_goto_slide_clamps_clicks_to_max(tmp_path: Path):
+def test_goto_slide_clamps_clicks_to_max(app_factory):
     """Clicks are clamped to max_clicks for the target slide."""
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# Slide 1\n<click>A</click>\n---\n# Slide 2")
-    app, _rt, _state = create_app(md_file)
-    sigs = parse_sse_signals(TestClient(app).get("/api/slide/0?clicks=100").text)
+    client = app_factory("# Slide 1\n<click>A</click>\n---\n# Slide 2")[3]
+    sigs = parse_sse_signals(client.get("/api/slide/0?clicks=100").content)
     assert sigs["clicks"] == 1  # max_clicks for slide 0 is 1
 
 
-def test_server_uses_motion_for_click_reveals(tmp_path: Path):
+# Computed signal defined at page level by Signal("vis1", clicks >= 1)
+@pytest.mark.parametrize("needle", ["data-motion=", "type:visibility", "data-computed:vis1", "signal:$vis1"])
+def test_server_uses_motion_for_click_reveals(home_html, needle):
     """Server-rendered slides use computed Signal + data-motion visibility."""
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# Slide\n<click>Reveal</click>")
-    app, _rt, _state = create_app(md_file)
-    html = TestClient(app).get("/").text
-    assert "data-motion=" in html
-    assert "type:visibility" in html
-    # Computed signal defined at page level by Signal("vis1", clicks >= 1)
-    assert "data-computed:vis1" in html
-    assert "signal:$vis1" in html
+    assert needle in home_html("# Slide\n<click>Reveal</click>")
 
 
-def test_motion_plugin_not_loaded_without_clicks(tmp_path: Path):
+@pytest.mark.parametrize("needle", ["data-motion=", "data-computed:vis"])
+def test_motion_plugin_not_loaded_without_clicks(home_html, needle):
     """Decks without <click> tags should not load the motion plugin JS."""
-    from stardeck.server import create_app
+    assert needle not in home_html("# Slide 1\n---\n# Slide 2")
 
-    md_file = mk_deck(tmp_path, "# Slide 1\n---\n# Slide 2")
-    app, _rt, _state = create_app(md_file)
-    html = TestClient(app).get("/").text
-    assert "data-motion=" not in html
-    assert "data-computed:vis" not in html
 
-
-def test_server_hide_uses_css_approach(tmp_path: Path):
+@pytest.mark.parametrize("needle", ["click-hide", "data-class:click-hidden"])
+def test_server_hide_uses_css_approach(home_html, needle):
     """Decks with <click hide> use CSS opacity transitions, not data-motion."""
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# Slide\n<click hide>Gone</click>\n<click>Show</click>")
-    app, _rt, _state = create_app(md_file)
-    html = TestClient(app).get("/").text
-    assert "click-hide" in html
-    assert "data-class:click-hidden" in html
+    assert needle in home_html("# Slide\n<click hide>Gone</click>\n<click>Show</click>")
 
 
-def test_server_range_signal(tmp_path: Path):
+def test_server_range_signal(home_html):
     """Decks with at= ranges produce vis_N_M computed signals."""
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, '# Slide\n<click at="2-4">Temp</click>')
-    app, _rt, _state = create_app(md_file)
-    html = TestClient(app).get("/").text
-    assert "data-computed:vis_2_4" in html
+    assert "data-computed:vis_2_4" in home_html('# Slide\n<click at="2-4">Temp</click>')
 
 
-def test_server_detects_after_tag(tmp_path: Path):
+def test_server_detects_after_tag(home_html):
     """Decks with only <after> tags still load motion plugin."""
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# Slide\n<click>A</click>\n<after>B</after>")
-    app, _rt, _state = create_app(md_file)
-    html = TestClient(app).get("/").text
-    assert "data-motion=" in html
+    assert "data-motion=" in home_html("# Slide\n<click>A</click>\n<after>B</after>")
 
 
-def test_server_detects_clicks_wrapper(tmp_path: Path):
+def test_server_detects_clicks_wrapper(home_html):
     """Decks with <clicks> wrapper load motion plugin."""
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# Slide\n<clicks>\n\nA\n\nB\n\n</clicks>")
-    app, _rt, _state = create_app(md_file)
-    html = TestClient(app).get("/").text
-    assert "data-motion=" in html
+    assert "data-motion=" in home_html("# Slide\n<clicks>\n\nA\n\nB\n\n</clicks>")
 
 
 # --- Presenter endpoints ---
 
 
-def test_presenter_next_endpoint(tmp_path: Path):
-    from stardeck.server import create_app
+@pytest.fixture
+def presenter_app(mutable_app_factory):
+    """Shared 3-slide presenter app; position and drawings are restored after each test."""
+    return mutable_app_factory("# S1\n---\n# S2\n---\n# S3")
 
-    md_file = mk_deck(tmp_path, "# S1\n---\n# S2\n---\n# S3")
-    app, _rt, state = create_app(md_file)
-    client = TestClient(app)
+
+@pytest.mark.presenter
+def test_presenter_next_endpoint(presenter_app):
+    _app, _rt, state, client = presenter_app
     resp = client.get("/api/presenter/next")
     assert resp.status_code == 200
     assert "text/event-stream" in resp.headers["content-type"]
     assert state.presentation.slide_index == 1
 
 
-def test_presenter_prev_endpoint(tmp_path: Path):
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# S1\n---\n# S2\n---\n# S3")
-    app, _rt, state = create_app(md_file)
+@pytest.mark.presenter
+def test_presenter_prev_endpoint(presenter_app):
+    _app, _rt, state, client = presenter_app
     pres = state.presentation
     pres.slide_index = 2
-    resp = TestClient(app).get("/api/presenter/prev")
+    resp = client.get("/api/presenter/prev")
     assert resp.status_code == 200
     assert pres.slide_index == 1
 
 
-def test_presenter_goto_endpoint(tmp_path: Path):
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# S1\n---\n# S2\n---\n# S3")
-    app, _rt, state = create_app(md_file)
-    resp = TestClient(app).get("/api/presenter/goto/2")
+@pytest.mark.presenter
+def test_presenter_goto_endpoint(presenter_app):
+    _app, _rt, state, client = presenter_app
+    resp = client.get("/api/presenter/goto/2")
     assert resp.status_code == 200
     assert state.presentation.slide_index == 2
 
 
-def test_presenter_changes_unauthorized(tmp_path: Path):
-    from stardeck.server import create_app
+@pytest.fixture
+def presenter_client(mutable_app_factory):
+    """(client, token) for the shared 1-slide deck; drawings are restored after each test."""
+    _app, _rt, state, client = mutable_app_factory("# S1")
+    return client, state.presenter_token
 
-    md_file = mk_deck(tmp_path, "# S1")
-    app, _rt, _state = create_app(md_file)
-    resp = TestClient(app).post("/api/presenter/changes?token=wrong", json={"changes": []})
-    assert resp.status_code == 401
 
+@pytest.mark.presenter
+def test_presenter_changes_unauthorized(presenter_client):
+    client, _token = presenter_client
+    resp = client.post("/api/presenter/changes?token=wrong", json={"changes": []})
+    assert resp.status_code == 401
 
-def test_presenter_changes_invalid_json(tmp_path: Path):
-    from stardeck.server import create_app
 
-    md_file = mk_deck(tmp_path, "# S1")
-    app, _rt, state = create_app(md_file)
-    token = state.presenter_token
-    resp = TestClient(app).post(
+@pytest.mark.presenter
+def test_presenter_changes_invalid_json(presenter_client):
+    client, token = presenter_client
+    resp = client.post(
         f"/api/presenter/changes?token={token}",
         content=b"not json",
         headers={"content-type": "application/json"},
@@ -263,14 +234,11 @@ def test_presenter_changes_invalid_json(tmp_path: Path):
     assert resp.status_code == 400
 
 
-def test_presenter_changes_applies_drawing(tmp_path: Path):
-    from stardeck.server import create_app
-
-    md_file = mk_deck(tmp_path, "# S1")
-    app, _rt, state = create_app(md_file)
-    token = state.presenter_token
+@pytest.mark.presenter
+def test_presenter_changes_applies_drawing(presenter_client):
+    client, token = presenter_client
     changes = [{"type": "path", "data": "M0,0 L10,10"}]
-    resp = TestClient(app).post(
+    resp = client.post(
         f"/api/presenter/changes?token={token}",
         json={"changes": changes, "slide_index": 0},
     )
@@ -281,105 +249,105 @@ def test_presenter_changes_applies_drawing(tmp_path: Path):
 # --- Yield presenter updates ---
 
 
-def test_yield_presenter_updates_emits_signals(tmp_path: Path):
-    from stardeck.parser import parse_deck
-    from stardeck.server import yield_presenter_updates
+@pytest.fixture(scope="module")
+def presenter_events(parsed_deck):
+    """yield_presenter_updates output per (markdown, slide, snapshot), built once per module."""
+
+    @cache
+    def build(text: str, idx: int, snapshot_json: str) -> list:
+        snapshot = json.loads(snapshot_json)
+        return list(yield_presenter_updates(parsed_deck(text), idx, drawing_snapshot=snapshot))
+
+    # Snapshots are lists of dicts; key the cache on their JSON form
+    def get(text: str, idx: int = 0, snapshot: list[dict] | None = None) -> list:
+        return build(text, idx, json.dumps(snapshot, sort_keys=True))
+
+    return get
 
-    md_file = mk_deck(tmp_path, "# S1\n---\n# S2")
-    deck = parse_deck(md_file)
-    events = list(yield_presenter_updates(deck, 0))
+
+@pytest.mark.presenter
+def test_yield_presenter_updates_emits_signals(presenter_events):
+    events = presenter_events("# S1\n---\n# S2")
     assert len(events) >= 3  # signals + current slide + next slide + notes
 
 
-def test_yield_presenter_updates_last_slide(tmp_path: Path):
+@pytest.mark.presenter
+def test_yield_presenter_updates_last_slide(presenter_events):
     """At last slide, next preview shows 'End of presentation'."""
-    from fastcore.xml import to_xml
-    from stardeck.parser import parse_deck
-    from stardeck.server import yield_presenter_updates
-
-    md_file = mk_deck(tmp_path, "# Only")
-    deck = parse_deck(md_file)
-    events = list(yield_presenter_updates(deck, 0))
-    html = "".join(to_xml(e) if hasattr(e, "__ft__") else str(e) for e in events)
+    html = "".join(to_xml(e) if hasattr(e, "__ft__") else str(e) for e in presenter_events("# Only"))
     assert "End of presentation" in html
 
 
-def test_yield_presenter_updates_with_snapshot(tmp_path: Path):
-    from stardeck.parser import parse_deck
-    from stardeck.server import yield_presenter_updates
-
-    md_file = mk_deck(tmp_path, "# S1")
-    deck = parse_deck(md_file)
-    snapshot = [{"type": "path", "data": "M0,0"}]
-    events = list(yield_presenter_updates(deck, 0, drawing_snapshot=snapshot))
+@pytest.mark.presenter
+def test_yield_presenter_updates_with_snapshot(presenter_events):
     # Should include the drawing script event
-    assert len(events) >= 4
-
-
-# --- PresentationState boundary ---
+    assert len(presenter_events("# S1", snapshot=[{"type": "path", "data": "M0,0"}])) >= 4
 
 
-def test_presentation_state_next_slide_at_end(tmp_path: Path):
-    from stardeck.parser import parse_deck
-    from stardeck.server import PresentationState
+# --- Reload with signal dependency change ---
 
-    md_file = mk_deck(tmp_path, "# Only")
-    deck = parse_deck(md_file)
-    pres = PresentationState(deck)
-    assert pres.next_slide is None
 
+@pytest.mark.parametrize(
+    ("before", "after"),
+    [
+        # More clicks raises max_clicks
+        ("# S1", "# S1\n<click>A</click>\n<click>B</click>"),
+        # A new at= range adds a vis_N_M signal
+        ("# S1\n<click>A</click>", '# S1\n<click>A</click>\n<click at="2-4">B</click>'),
+    ],
+    ids=["new_clicks", "new_ranges"],
+)
+def test_reload_triggers_page_reload_on_new_signals(deck_file: Path, before, after):
+    """When the reloaded deck needs new click signals, force a full page reload."""
+    deck_file.write_text(before)
+    app, _rt, _state = create_app(deck_file)
+    client = TestClient(app)
 
-def test_presentation_state_next_slide_exists(tmp_path: Path):
-    from stardeck.parser import parse_deck
-    from stardeck.server import PresentationState
+    deck_file.write_text(after)
+    resp = client.get("/api/reload")
+    assert "window.location.reload()" in resp.text
 
-    md_file = mk_deck(tmp_path, "# S1\n---\n# S2")
-    deck = parse_deck(md_file)
-    pres = PresentationState(deck)
-    assert pres.next_slide is not None
-    assert pres.next_slide.index == 1
 
+# --- Assets dir registration ---
 
-# --- Reload with signal dependency change ---
 
+def _has_assets_route(app) -> bool:
+    return any(getattr(route, "path", "").startswith("/assets") for route in app.routes)
 
-def test_reload_triggers_page_reload_on_new_clicks(tmp_path: Path):
-    """When reloaded deck has more click signals, force full page reload."""
-    from stardeck.server import create_app
 
+def test_server_with_assets_dir(tmp_path: Path, app_factory):
     md_file = mk_deck(tmp_path, "# S1")
-    app, _rt, state = create_app(md_file)
-    client = TestClient(app)
-
-    # Rewrite file to have clicks (increases max_clicks)
-    md_file.write_text("# S1\n<click>A</click>\n<click>B</click>")
-    resp = client.get("/api/reload")
-    assert "window.location.reload()" in resp.text
-
+    (tmp_path / "assets").mkdir()
+    app, _rt, _state = create_app(md_file)
+    # Registration is all this checks; serving is the static files app's job
+    assert _has_assets_route(app)
+    assert not _has_assets_route(app_factory(THREE_SLIDES)[0])
 
-def test_reload_triggers_page_reload_on_new_ranges(tmp_path: Path):
-    """When reloaded deck has new range signals, force full page reload."""
-    from stardeck.server import create_app
 
-    md_file = mk_deck(tmp_path, "# S1\n<click>A</click>")
-    app, _rt, state = create_app(md_file)
+def test_home_reflects_navigation_and_reload(deck_file: Path):
+    """Cached home pages are keyed on position and dropped on reload."""
+    deck_file.write_text("# Alpha\n---\n# Beta")
+    app, _rt, state = create_app(deck_file)
     client = TestClient(app)
 
-    md_file.write_text('# S1\n<click>A</click>\n<click at="2-4">B</click>')
-    resp = client.get("/api/reload")
-    assert "window.location.reload()" in resp.text
+    assert "Alpha" in client.get("/").text
+    state.presentation.goto_slide(1)
+    assert "Beta" in client.get("/").text
 
+    deck_file.write_text("# Alpha\n---\n# Gamma")
+    client.get("/api/reload?slide_index=1")
+    assert "Gamma" in client.get("/").text
 
-# --- Assets dir registration ---
 
+def test_slide_events_rebuilt_after_reload(deck_file: Path):
+    deck_file.write_text("# Alpha\n---\n# Beta")
+    app, _rt, _state = create_app(deck_file)
+    client = TestClient(app)
 
-def test_server_with_assets_dir(tmp_path: Path):
-    from stardeck.server import create_app
+    first = client.get("/api/slide/1").text
+    assert "Beta" in first
+    assert client.get("/api/slide/next?slide_index=0").text == first
 
-    md_file = mk_deck(tmp_path, "# S1")
-    (tmp_path / "assets").mkdir()
-    (tmp_path / "assets" / "img.png").write_bytes(b"\x89PNG")
-    app, _rt, _state = create_app(md_file)
-    # Asset should be served
-    resp = TestClient(app).get("/assets/img.png")
-    assert resp.status_code == 200
+    deck_file.write_text("# Alpha\n---\n# Gamma")
+    client.get("/api/reload")
+    assert "Gamma" in client.get("/api/slide/1").text
@@ -1,5 +1,6 @@
 """Unit tests for PresentationState — pure state machine, no HTTP."""
 
+import pytest
 from stardeck.models import Deck, DeckConfig, SlideInfo
 from stardeck.server import PresentationState
 
@@ -15,125 +16,87 @@ def _deck(*max_clicks_per_slide: int) -> Deck:
 # --- TestNext ---
 
 
-def test_next_increments_clicks_below_max():
-    pres = PresentationState(_deck(2, 0))
+@pytest.mark.parametrize(
+    ("max_clicks", "start", "expected"),
+    [
+        pytest.param((2, 0), (0, 0), (0, 1), id="increments_clicks_below_max"),
+        pytest.param((1, 0), (0, 1), (1, 0), id="advances_slide_at_max_clicks"),
+        pytest.param((0, 0), (1, 0), (1, 0), id="noop_at_last_slide_max_clicks"),
+        pytest.param((2, 3), (0, 2), (1, 0), id="resets_clicks_on_advance"),
+    ],
+)
+def test_next(max_clicks, start, expected):
+    pres = PresentationState(_deck(*max_clicks))
+    pres.slide_index, pres.clicks = start
     pres.next()
-    assert pres.slide_index == 0
-    assert pres.clicks == 1
-
-
-def test_next_advances_slide_at_max_clicks():
-    pres = PresentationState(_deck(1, 0))
-    pres.clicks = 1
-    pres.next()
-    assert pres.slide_index == 1
-    assert pres.clicks == 0
-
-
-def test_next_noop_at_last_slide_max_clicks():
-    pres = PresentationState(_deck(0, 0))
-    pres.slide_index = 1
-    pres.next()
-    assert pres.slide_index == 1
-
-
-def test_next_resets_clicks_on_advance():
-    pres = PresentationState(_deck(2, 3))
-    pres.clicks = 2
-    pres.next()
-    assert pres.slide_index == 1
-    assert pres.clicks == 0
+    assert (pres.slide_index, pres.clicks) == expected
 
 
 # --- TestPrev ---
 
 
-def test_prev_decrements_clicks_above_zero():
-    pres = PresentationState(_deck(3, 0))
-    pres.clicks = 2
-    pres.prev()
-    assert pres.slide_index == 0
-    assert pres.clicks == 1
-
-
-def test_prev_goes_to_prev_slide_at_zero_clicks():
-    pres = PresentationState(_deck(2, 0))
-    pres.slide_index = 1
-    pres.clicks = 0
+@pytest.mark.parametrize(
+    ("max_clicks", "start", "expected"),
+    [
+        pytest.param((3, 0), (0, 2), (0, 1), id="decrements_clicks_above_zero"),
+        # Landing on the previous slide restores its max_clicks
+        pytest.param((2, 0), (1, 0), (0, 2), id="goes_to_prev_slide_at_zero_clicks"),
+        pytest.param((0, 0), (0, 0), (0, 0), id="noop_at_first_slide_zero_clicks"),
+        pytest.param((5, 0), (1, 0), (0, 5), id="sets_clicks_to_prev_slide_max"),
+    ],
+)
+def test_prev(max_clicks, start, expected):
+    pres = PresentationState(_deck(*max_clicks))
+    pres.slide_index, pres.clicks = start
     pres.prev()
-    assert pres.slide_index == 0
-    assert pres.clicks == 2  # prev slide's max_clicks
-
-
-def test_prev_noop_at_first_slide_zero_clicks():
-    pres = PresentationState(_deck(0, 0))
-    pres.prev()
-    assert pres.slide_index == 0
-    assert pres.clicks == 0
-
-
-def test_prev_sets_clicks_to_prev_slide_max():
-    pres = PresentationState(_deck(5, 0))
-    pres.slide_index = 1
-    pres.prev()
-    assert pres.clicks == 5
+    assert (pres.slide_index, pres.clicks) == expected
 
 
 # --- TestGotoSlide ---
 
 
-def test_goto_basic():
-    pres = PresentationState(_deck(0, 0, 0))
-    pres.goto_slide(2)
-    assert pres.slide_index == 2
-    assert pres.clicks == 0
+@pytest.mark.parametrize(
+    ("max_clicks", "args", "expected"),
+    [
+        pytest.param((0, 0, 0), (2,), (2, 0), id="basic"),
+        pytest.param((0, 0), (99,), (1, 0), id="clamps_index_high"),
+        pytest.param((0, 0), (-5,), (0, 0), id="clamps_index_low"),
+        pytest.param((2, 0), (0, 100), (0, 2), id="clamps_clicks_to_max"),
+        pytest.param((3, 0), (0, 2), (0, 2), id="accepts_valid_clicks"),
+    ],
+)
+def test_goto(max_clicks, args, expected):
+    pres = PresentationState(_deck(*max_clicks))
+    pres.goto_slide(*args)
+    assert (pres.slide_index, pres.clicks) == expected
 
 
-def test_goto_clamps_index_high():
-    pres = PresentationState(_deck(0, 0))
-    pres.goto_slide(99)
-    assert pres.slide_index == 1
-
-
-def test_goto_clamps_index_low():
-    pres = PresentationState(_deck(0, 0))
-    pres.goto_slide(-5)
-    assert pres.slide_index == 0
-
-
-def test_goto_clamps_clicks_to_max():
-    pres = PresentationState(_deck(2, 0))
-    pres.goto_slide(0, clicks=100)
-    assert pres.clicks == 2
-
-
-def test_goto_accepts_valid_clicks():
-    pres = PresentationState(_deck(3, 0))
-    pres.goto_slide(0, clicks=2)
-    assert pres.clicks == 2
+# --- TestReloadDeck ---
 
 
-# --- TestReloadDeck ---
+@pytest.mark.parametrize(
+    ("before", "start", "after", "expected"),
+    [
+        pytest.param((0, 0, 0), (2, 0), (0,), (0, 0), id="clamps_slide_index"),
+        pytest.param((5,), (0, 5), (2,), (0, 2), id="clamps_clicks"),
+        pytest.param((3, 3, 3), (1, 2), (3, 3, 3), (1, 2), id="preserves_in_bounds_state"),
+    ],
+)
+def test_reload(before, start, after, expected):
+    pres = PresentationState(_deck(*before))
+    pres.slide_index, pres.clicks = start
+    pres.reload_deck(_deck(*after))
+    assert (pres.slide_index, pres.clicks) == expected
 
 
-def test_reload_clamps_slide_index():
-    pres = PresentationState(_deck(0, 0, 0))
-    pres.slide_index = 2
-    pres.reload_deck(_deck(0))  # now only 1 slide
-    assert pres.slide_index == 0
+# --- TestNextSlide ---
 
 
-def test_reload_clamps_clicks():
-    pres = PresentationState(_deck(5))
-    pres.clicks = 5
-    pres.reload_deck(_deck(2))  # max_clicks now 2
-    assert pres.clicks == 2
+def test_next_slide_none_at_end():
+    assert PresentationState(_deck(0)).next_slide is None
 
 
-def test_reload_preserves_in_bounds_state():
-    pres = PresentationState(_deck(3, 3, 3))
-    pres.slide_index = 1
-    pres.clicks = 2
-    pres.reload_deck(_deck(3, 3, 3))
-    assert pres.slide_index == 1
-    assert pres.clicks == 2
+def test_next_slide_exists():
+    pres = PresentationState(_deck(0, 0))
+    assert pres.next_slide is not None
+    assert pres.next_slide.index == 1
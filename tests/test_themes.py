@@ -15,6 +15,10 @@ def test_get_theme_css_light_returns_css():
     assert "stardeck-root" in css
 
 
+def test_get_theme_css_read_once():
+    assert get_theme_css("default") is get_theme_css("default")
+
+
 def test_get_theme_css_nonexistent_raises():
     with pytest.raises(FileNotFoundError):
         get_theme_css("nonexistent_theme_xyz")
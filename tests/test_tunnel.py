@@ -1,117 +1,102 @@
-from unittest.mock import MagicMock, patch
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 from click.testing import CliRunner
 from stardeck.cli import cli, start_tunnel, stop_tunnel
 
 
-def test_start_tunnel_no_ssh():
-    with patch("stardeck.cli.shutil.which", return_value=None):
-        with pytest.raises(FileNotFoundError, match="SSH not found"):
-            start_tunnel(5001)
-
-
-def test_url_extraction():
-    mock_proc = MagicMock()
-    mock_proc.stdout.fileno.return_value = 99
-    mock_proc.poll.return_value = None
-
-    with (
-        patch("stardeck.cli.shutil.which", return_value="/usr/bin/ssh"),
-        patch("stardeck.cli.subprocess.Popen", return_value=mock_proc),
-        patch("stardeck.cli.select.select", return_value=([99], [], [])),
-        patch(
-            "stardeck.cli.os.read",
-            side_effect=[
-                b"Warning: Permanently added 'a.pinggy.io' to known hosts.\n",
-                b"http://rndzz-123.a.free.pinggy.link\n",
-                b"https://rndzz-123.a.free.pinggy.link\n",
-            ],
-        ),
-        patch("stardeck.cli.threading.Thread") as mock_thread,
-    ):
-        proc, url = start_tunnel(5001)
+@pytest.fixture
+def fake_proc():
+    """Stand-in for the ssh Popen: stdout on fd 99, still running. Tests override per scenario."""
+    proc = MagicMock()
+    proc.stdout.fileno.return_value = 99
+    proc.poll.return_value = None
+    return proc
+
+
+@pytest.fixture
+def fake_ssh(monkeypatch, fake_proc):
+    """Point start_tunnel at fake_proc → namespace with the Popen argv list and the Thread mock."""
+    fake = SimpleNamespace(cmds=[], thread=MagicMock())
+
+    def popen(cmd, **_kwargs):
+        fake.cmds.append(cmd)
+        return fake_proc
+
+    monkeypatch.setattr("stardeck.cli.shutil.which", lambda _name: "/usr/bin/ssh")
+    monkeypatch.setattr("stardeck.cli.subprocess.Popen", popen)
+    monkeypatch.setattr("stardeck.cli.threading.Thread", fake.thread)
+    return fake
 
-    assert url == "https://rndzz-123.a.free.pinggy.link"
-    assert proc is mock_proc
-    mock_thread.return_value.start.assert_called_once()
 
+def _ssh_output(monkeypatch, output: bytes) -> None:
+    """Make stdout always ready and serve `output` through os.read, then EOF."""
+    stdout = io.BytesIO(output)
+    monkeypatch.setattr("stardeck.cli.select.select", lambda r, _w, _x, _timeout: (r, [], []))
+    monkeypatch.setattr("stardeck.cli.os.read", lambda _fd, n: stdout.read(n))
 
-def test_start_tunnel_timeout():
-    mock_proc = MagicMock()
-    mock_proc.stdout.fileno.return_value = 99
-    mock_proc.stdout.readable.return_value = True
-    mock_proc.stdout.read.return_value = "connection refused\n"
-    mock_proc.poll.return_value = None
 
-    with (
-        patch("stardeck.cli.shutil.which", return_value="/usr/bin/ssh"),
-        patch("stardeck.cli.subprocess.Popen", return_value=mock_proc),
-        patch("stardeck.cli.select.select", return_value=([], [], [])),
-        patch("stardeck.cli._STARTUP_TIMEOUT", 0),
-    ):
-        with pytest.raises(RuntimeError, match="Could not establish tunnel"):
-            start_tunnel(5001)
+def test_start_tunnel_no_ssh(monkeypatch):
+    monkeypatch.setattr("stardeck.cli.shutil.which", lambda _name: None)
+    with pytest.raises(FileNotFoundError, match="SSH not found"):
+        start_tunnel(5001)
+
+
+def test_url_extraction(monkeypatch, fake_ssh, fake_proc):
+    _ssh_output(
+        monkeypatch,
+        b"Warning: Permanently added 'a.pinggy.io' to known hosts.\n"
+        b"http://rndzz-123.a.free.pinggy.link\n"
+        b"https://rndzz-123.a.free.pinggy.link\n",
+    )
+    proc, url = start_tunnel(5001)
+
+    assert url == "https://rndzz-123.a.free.pinggy.link"
+    assert proc is fake_proc
+    fake_ssh.thread.return_value.start.assert_called_once()
+
 
-    mock_proc.terminate.assert_called_once()
+def test_start_tunnel_timeout(monkeypatch, fake_ssh, fake_proc):
+    monkeypatch.setattr("stardeck.cli.select.select", lambda r, _w, _x, _timeout: ([], [], []))
+    monkeypatch.setattr("stardeck.cli._STARTUP_TIMEOUT", 0)
 
+    with pytest.raises(RuntimeError, match="Could not establish tunnel"):
+        start_tunnel(5001)
 
-def test_start_tunnel_ssh_exits_early():
-    mock_proc = MagicMock()
-    mock_proc.stdout.fileno.return_value = 99
-    mock_proc.poll.side_effect = [None, 1]
+    fake_proc.terminate.assert_called_once()
 
-    with (
-        patch("stardeck.cli.shutil.which", return_value="/usr/bin/ssh"),
-        patch("stardeck.cli.subprocess.Popen", return_value=mock_proc),
-        patch("stardeck.cli.select.select", return_value=([99], [], [])),
-        patch("stardeck.cli.os.read", return_value=b""),
-    ):
-        with pytest.raises(RuntimeError, match="Could not establish tunnel"):
-            start_tunnel(5001)
 
+def test_start_tunnel_ssh_exits_early(monkeypatch, fake_ssh, fake_proc):
+    fake_proc.poll.side_effect = [None, 1]
+    _ssh_output(monkeypatch, b"")
 
-def test_start_tunnel_uses_pro_host_with_token():
-    mock_proc = MagicMock()
-    mock_proc.stdout.fileno.return_value = 99
-    mock_proc.poll.return_value = None
+    with pytest.raises(RuntimeError, match="Could not establish tunnel"):
+        start_tunnel(5001)
 
-    with (
-        patch("stardeck.cli.shutil.which", return_value="/usr/bin/ssh"),
-        patch("stardeck.cli.subprocess.Popen", return_value=mock_proc) as mock_popen,
-        patch("stardeck.cli.select.select", return_value=([99], [], [])),
-        patch(
-            "stardeck.cli.os.read",
-            side_effect=[
-                b"https://myapp.a.pinggy.online\n",
-            ],
-        ),
-        patch("stardeck.cli.threading.Thread"),
-    ):
-        start_tunnel(5001, token="abc123")
 
-    cmd = mock_popen.call_args[0][0]
-    assert "abc123@pro.pinggy.io" in cmd
+def test_start_tunnel_uses_pro_host_with_token(monkeypatch, fake_ssh):
+    _ssh_output(monkeypatch, b"https://myapp.a.pinggy.online\n")
+    start_tunnel(5001, token="abc123")
 
+    assert "abc123@pro.pinggy.io" in fake_ssh.cmds[0]
 
-def test_stop_tunnel_already_dead():
-    mock_proc = MagicMock()
-    mock_proc.terminate.side_effect = ProcessLookupError
 
-    stop_tunnel(mock_proc)
+def test_stop_tunnel_already_dead(fake_proc):
+    fake_proc.terminate.side_effect = ProcessLookupError
 
-    mock_proc.terminate.assert_called_once()
-    mock_proc.wait.assert_not_called()
+    stop_tunnel(fake_proc)
 
+    fake_proc.terminate.assert_called_once()
+    fake_proc.wait.assert_not_called()
 
-def test_stop_tunnel_terminates():
-    mock_proc = MagicMock()
-    mock_proc.poll.return_value = None
 
-    stop_tunnel(mock_proc)
+def test_stop_tunnel_terminates(fake_proc):
+    stop_tunnel(fake_proc)
 
-    mock_proc.terminate.assert_called_once()
-    mock_proc.wait.assert_called_once_with(timeout=5)
+    fake_proc.terminate.assert_called_once()
+    fake_proc.wait.assert_called_once_with(timeout=5)
 
 
 def test_cli_share_flag_exists():
@@ -5,31 +5,29 @@ import asyncio
 import pytest
 from stardeck.server import FileWatcher
 
+pytestmark = pytest.mark.watch
 
-@pytest.mark.asyncio
+
+@pytest.mark.anyio
 async def test_file_watcher_detects_change(tmp_path):
     """Watcher should detect file modification."""
     md_file = tmp_path / "slides.md"
     md_file.write_text("# Slide 1")
 
-    changes_detected = []
-    watcher = FileWatcher(md_file, lambda: changes_detected.append(True))
+    changed = asyncio.Event()
+    watcher = FileWatcher(md_file, changed.set, step_ms=20)
 
     task = asyncio.create_task(watcher.start())
-    await asyncio.sleep(0.1)
+    await asyncio.sleep(0.1)  # let the watcher arm before writing
 
     md_file.write_text("# Slide 1 modified")
-    await asyncio.sleep(0.5)
+    await asyncio.wait_for(changed.wait(), timeout=2.0)
 
+    # stop() ends the awatch loop on its next step, so the task finishes without cancel()
     watcher.stop()
-    await asyncio.sleep(0.1)
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
-
-    assert len(changes_detected) > 0
+    await asyncio.wait_for(task, timeout=2.0)
+
+    assert changed.is_set()
 
 
 def test_file_watcher_resolves_path(tmp_path):